@@ -1,4 +1,6 @@
 import re
+from pathlib import Path
+from typing import Optional
 
 from langchain import hub
 from langchain_community.agent_toolkits import SQLDatabaseToolkit
@@ -9,6 +11,50 @@ from langgraph.prebuilt import create_react_agent
 
 from .utils import data_to_table, format_query
 
+_FROM_RE = re.compile(r"FROM\s+(\w+)", re.IGNORECASE)
+
+_SQL_PROMPT_CACHE = Path(".cache/sql_prompt.txt")
+
+_LLM: Optional[ChatOpenAI] = None
+_AGENT = None
+
+
+def _get_llm() -> ChatOpenAI:
+    """Return the shared agent LLM, creating it on first use."""
+    global _LLM
+    if _LLM is None:
+        _LLM = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return _LLM
+
+
+def _get_sql_system_prompt() -> str:
+    """Return the SQL agent system prompt, pulling it from LangChain Hub only when it is not cached on disk."""
+    if _SQL_PROMPT_CACHE.exists():
+        return _SQL_PROMPT_CACHE.read_text(encoding="utf-8")
+
+    sql_prompt = hub.pull("langchain-ai/sql-agent-system-prompt")
+    sql_system_prompt = sql_prompt.messages[0].prompt.template
+
+    _SQL_PROMPT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    _SQL_PROMPT_CACHE.write_text(sql_system_prompt, encoding="utf-8")
+    return sql_system_prompt
+
+
+def _get_agent():
+    """Return the shared ReAct SQL agent, creating it on first use."""
+    global _AGENT
+    if _AGENT is None:
+        db = SQLDatabase.from_uri("sqlite:///databases/Chinook.db")
+        sql_system_prompt = _get_sql_system_prompt()
+
+        llm = _get_llm()
+        toolkit = SQLDatabaseToolkit(db=db, llm=llm)
+        tools = toolkit.get_tools()
+        print(tools)
+
+        _AGENT = create_react_agent(llm, tools, state_modifier=sql_system_prompt)
+    return _AGENT
+
 
 def text_to_sql_react(user_message: str) -> str:
     """
@@ -29,17 +75,7 @@ def text_to_sql_react(user_message: str) -> str:
             - SQL query used
             - Query results in table format
     """
-    db = SQLDatabase.from_uri("sqlite:///databases/Chinook.db")
-
-    sql_prompt = hub.pull("langchain-ai/sql-agent-system-prompt")
-    sql_system_prompt = sql_prompt.messages[0].prompt.template
-
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    toolkit = SQLDatabaseToolkit(db=db, llm=llm)
-    tools = toolkit.get_tools()
-    print(tools)
-
-    agent = create_react_agent(llm, tools, state_modifier=sql_system_prompt)
+    agent = _get_agent()
 
     config = {"configurable": {"session_id": "text-to-sql-react-chain-session"}}
     dialect = "SQLite"
@@ -55,21 +91,26 @@ def text_to_sql_react(user_message: str) -> str:
             config,
         )
 
-        # Trace the query execution in reverse manner
-        reversed_messages = reversed(response["messages"])
-
-        answer_msg = next((msg for msg in reversed_messages if isinstance(msg, AIMessage)), None)
-        answer = answer_msg.content if answer_msg else ""
-
-        data_msg = next((msg for msg in reversed_messages if isinstance(msg, ToolMessage) and msg.name == "sql_db_query"), None)
-        data = data_msg.content if data_msg else ""
-        query_call_id = data_msg.tool_call_id if data_msg else ""
-
-        # Find the query execution matching the query call id
-        query_msg = next((msg for msg in reversed_messages if isinstance(msg, AIMessage) and msg.tool_calls and any(call["id"] == query_call_id for call in msg.tool_calls)), None)
-        query = query_msg.tool_calls[0]["args"]["query"] if query_msg else ""
-
-        table_name = re.search(r"FROM\s+(\w+)", query, re.IGNORECASE).group(1) if query != "" else ""
+        # Trace the query execution in reverse manner, in a single pass
+        answer_msg = data_msg = query_call = None
+        query_call_id = None
+        for msg in reversed(response["messages"]):
+            if answer_msg is None and isinstance(msg, AIMessage) and not msg.tool_calls:
+                answer_msg = msg
+            elif data_msg is None and isinstance(msg, ToolMessage) and msg.name == "sql_db_query":
+                data_msg = msg
+                query_call_id = msg.tool_call_id
+            # Find the query execution matching the query call id
+            elif query_call is None and data_msg is not None and isinstance(msg, AIMessage) and msg.tool_calls:
+                query_call = next((call for call in msg.tool_calls if call["id"] == query_call_id), None)
+            if answer_msg is not None and data_msg is not None and query_call is not None:
+                break
+
+        answer = answer_msg.content if answer_msg is not None else ""
+        data = data_msg.content if data_msg is not None else ""
+        query = query_call["args"]["query"] if query_call is not None else ""
+
+        table_name = _FROM_RE.search(query).group(1) if query != "" else ""
 
         if data and query:
             return f"""
@@ -3,6 +3,9 @@ import re
 
 from tabulate import tabulate
 
+_SELECT_RE = re.compile(r"SELECT\s+(.*?)\s+FROM", re.IGNORECASE)
+_AS_RE = re.compile(r"\s+as\s+", re.IGNORECASE)
+
 
 def format_query(query: str) -> str:
     """Format SQL query with proper line breaks and indentation.
@@ -64,9 +67,9 @@ def data_to_table(query: str, data: str) -> str:
     headers = []
     if query and isinstance(query, str):  # Check if query exists and is a string
         # Extract column headers from SELECT clause
-        SELECT_clause = re.search(r"SELECT\s+(.*?)\s+FROM", query, re.IGNORECASE).group(1)
+        SELECT_clause = _SELECT_RE.search(query).group(1)
         headers = [col.strip() for col in SELECT_clause.split(",")]
-        headers = [re.split(r"\s+as\s+", col.strip(), flags=re.IGNORECASE)[-1] for col in headers]
+        headers = [_AS_RE.split(col.strip())[-1] for col in headers]
 
     # Parse data string into list of tuples - handle empty string case
     data_list = ast.literal_eval(data) if (isinstance(data, str) and data.strip()) else []
@@ -0,0 +1,41 @@
+import numpy as np
+from numba import njit
+
+# Valid ASCII codepoints as a 128-bit bitmap split over two words, checked with a single shift and mask
+_ASCII_BITMAP = sum(1 << c for c in (0x09, 0x0A, 0x0D, *range(0x20, 0x7F)))
+_ASCII_WORDS = np.array([_ASCII_BITMAP & (2**64 - 1), _ASCII_BITMAP >> 64], dtype=np.uint64)
+# Sorted, non-overlapping valid non-ASCII ranges (misc symbols and dingbats are adjacent, so merged)
+_RANGE_STARTS = np.array([0x2600, 0x4E00, 0x1F300], dtype=np.uint32)
+_RANGE_ENDS = np.array([0x27BF, 0x9FFF, 0x1F9FF], dtype=np.uint32)
+
+
+@njit(cache=True)
+def _filter_numba(cp: np.ndarray, out: np.ndarray, ascii_words: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> int:
+    """Copy the valid codepoints of `cp` into `out` and return how many were kept."""
+    n = 0
+    for i in range(cp.shape[0]):
+        c = cp[i]
+        out[n] = c
+        if c < 128:
+            valid = (ascii_words[c >> 6] >> (c & 63)) & 1
+        else:
+            j = np.searchsorted(starts, c, side="right") - 1
+            valid = j >= 0 and c <= ends[j]
+        # Always write, only advance on valid codepoints
+        n += valid
+    return n
+
+
+def filter_garbage_numba(text: str) -> str:
+    """Remove garbage characters from a long string by scanning its UTF-32 codepoints with Numba.
+
+    Args:
+        text (str): The input string containing various characters
+
+    Returns:
+        str: The string with garbage characters removed, whitespace is left as is
+    """
+    cp = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    out = np.empty_like(cp)
+    n = _filter_numba(cp, out, _ASCII_WORDS, _RANGE_STARTS, _RANGE_ENDS)
+    return out[:n].tobytes().decode("utf-32-le")
@@ -1,14 +1,76 @@
+import copy
+import functools
+import hashlib
+import io
 import os
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Optional
 
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from tavily import TavilyClient
 
+# Only needed to summarize content, so searching still works without them
+try:
+    import httpx
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_openai import ChatOpenAI
+except ImportError:
+    ChatPromptTemplate = ChatOpenAI = None
+
 load_dotenv()
 
+_TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY")
+
+# Anything outside printable ASCII, common whitespace controls, Chinese characters, misc symbols, dingbats and emojis
+_GARBAGE_RE = re.compile(r"[^\x20-\x7e\n\t\r\u4e00-\u9fff\u2600-\u26ff\u2700-\u27bf\U0001f300-\U0001f9ff]")
+_MULTI_NL = re.compile(r"\n{3,}")
+_MULTI_SP = re.compile(r" {2,}")
+# Translation table deleting the ASCII control characters other than \t, \n and \r
+_ASCII_STRIP = dict.fromkeys([*range(0, 9), 11, 12, *range(14, 32), 127])
+
+# Texts at least this long are filtered with the Numba kernel when it is available
+_NUMBA_MIN_LENGTH = 8192
+# Loaded lazily by _get_numba_filter, False once numba is known to be unavailable
+_NUMBA_FILTER = None
+
+# Keep-alive connections kept open to Tavily, enough for websearch_many to fan out without reconnecting
+_TAVILY_POOL_SIZE = 16
+
+_TAVILY_CLIENT: Optional[TavilyClient] = None
+_SUMMARIZER = None
+_SUMMARY_CHAIN = None
+
+_SUMMARY_PROMPT = (
+    ChatPromptTemplate.from_messages(
+        [
+            ("system", "Summarize the following content in 200 words: {raw_content}"),
+        ]
+    )
+    if ChatPromptTemplate is not None
+    else None
+)
+
+# Summaries keyed by a digest of the raw content they were generated from, evicted least recently used first
+_SUMMARY_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_SUMMARY_CACHE_SIZE = 256
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+# Seconds a cached Tavily response stays valid, so long-running agents still see fresh results
+_TAVILY_CACHE_TTL = 600
+
+# `slots` is only accepted by dataclass from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SearchArgs:
     query: str
     max_results: int = 5
@@ -17,24 +79,96 @@ class SearchArgs:
     suggested_answer: bool = False
 
 
+def _get_tavily() -> TavilyClient:
+    """Return the shared Tavily client, creating it on first use."""
+    global _TAVILY_CLIENT
+    if _TAVILY_CLIENT is None:
+        if not _TAVILY_API_KEY:
+            raise KeyError("TAVILY_API_KEY not set")
+        _TAVILY_CLIENT = TavilyClient(api_key=_TAVILY_API_KEY)
+        # Recent clients send every request through a shared requests.Session, widen its pool so connections are reused
+        session = getattr(_TAVILY_CLIENT, "session", None)
+        if isinstance(session, requests.Session):
+            session.mount("https://", HTTPAdapter(pool_connections=_TAVILY_POOL_SIZE, pool_maxsize=_TAVILY_POOL_SIZE, max_retries=2))
+    return _TAVILY_CLIENT
+
+
+def _get_summarizer():
+    """Return the shared summarizer LLM, creating it on first use.
+
+    The sync HTTP client keeps connections alive so repeated summaries reuse them. Summaries must go through the sync
+    `batch`/`invoke` path for this to apply, since `http_client` does not configure the async OpenAI client.
+    """
+    global _SUMMARIZER
+    if _SUMMARIZER is None:
+        if ChatOpenAI is None:
+            raise ImportError("langchain-openai is required to summarize content")
+        _SUMMARIZER = ChatOpenAI(
+            model="gpt-4o-mini",
+            temperature=0,
+            http_client=httpx.Client(limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)),
+        )
+    return _SUMMARIZER
+
+
+def _get_summary_chain():
+    """Return the shared summarization chain, creating it on first use."""
+    global _SUMMARY_CHAIN
+    if _SUMMARY_CHAIN is None:
+        _SUMMARY_CHAIN = _SUMMARY_PROMPT | _get_summarizer()
+    return _SUMMARY_CHAIN
+
+
+@functools.lru_cache(maxsize=256)
+def _tavily_search_cached(query: str, max_results: int, include_raw_content: bool, ttl_bucket: int) -> dict:
+    """Execute a Tavily search query, reusing the response for repeated identical searches.
+
+    `ttl_bucket` changes every `_TAVILY_CACHE_TTL` seconds, which expires the cached responses.
+    """
+    return _get_tavily().search(
+        query,
+        max_results=max_results,
+        search_depth="advanced",
+        include_answer=True,
+        include_raw_content=include_raw_content,
+        include_image=False,
+    )
+
+
+def clear_search_cache() -> None:
+    """Drop all cached Tavily responses and content summaries."""
+    _tavily_search_cached.cache_clear()
+    with _SUMMARY_CACHE_LOCK:
+        _SUMMARY_CACHE.clear()
+
+
 def tavily_search(args: SearchArgs) -> dict:
     """Execute a Tavily search query.
 
     Args:
-        args (SearchArgs): Search arguments containing query and max_results
+        args (SearchArgs): Search arguments containing query and max_results, raw content is only requested when summarizing
 
     Returns:
         dict: Raw Tavily API response
     """
-    tavily_client = TavilyClient(api_key=os.environ["TAVILY_API_KEY"])
-    return tavily_client.search(
-        args.query,
-        max_results=args.max_results,
-        search_depth="advanced",
-        include_answer=True,
-        include_raw_content=True,
-        include_image=False,
-    )
+    # Deep copy so callers can process the response without corrupting the cached one
+    return copy.deepcopy(_tavily_search_cached(args.query, args.max_results, args.summarize_content, int(time.monotonic() // _TAVILY_CACHE_TTL)))
+
+
+def _get_numba_filter():
+    """Return the Numba codepoint filter, importing it on first use, or None when numba is not installed.
+
+    Importing numba is slow, so it is deferred until a text is long enough to benefit from it.
+    """
+    global _NUMBA_FILTER
+    if _NUMBA_FILTER is None:
+        try:
+            from .numba_filter import filter_garbage_numba
+        except ImportError:
+            _NUMBA_FILTER = False
+        else:
+            _NUMBA_FILTER = filter_garbage_numba
+    return _NUMBA_FILTER or None
 
 
 def filter_garbage(text: str) -> str:
@@ -46,45 +180,92 @@ def filter_garbage(text: str) -> str:
     Returns:
         str: A cleaned string with garbage characters removed
     """
-    PRINTABLE_ASCII = lambda c: 32 <= ord(c) <= 126
-    CONTROL_CHARS = "\n\t\r"
-    CHINESE = lambda c: "\u4e00" <= c <= "\u9fff"
-    MISC_SYMBOLS = lambda c: "\u2600" <= c <= "\u26FF"
-    DINGBATS = lambda c: "\u2700" <= c <= "\u27BF"
-    EMOJIS = lambda c: "\U0001F300" <= c <= "\U0001F9FF"
+    # search() stops at the first hit, so clean text skips the substitution pass entirely
+    if _GARBAGE_RE.search(text) is None:
+        cleaned_text = text
+    elif text.isascii():
+        cleaned_text = text.translate(_ASCII_STRIP)
+    elif len(text) >= _NUMBA_MIN_LENGTH and _get_numba_filter() is not None:
+        cleaned_text = _get_numba_filter()(text)
+    else:
+        cleaned_text = _GARBAGE_RE.sub("", text)
+    if "\n\n\n" in cleaned_text:
+        cleaned_text = _MULTI_NL.sub("\n\n", cleaned_text)
+    if "  " in cleaned_text:
+        cleaned_text = _MULTI_SP.sub(" ", cleaned_text)
 
-    def is_valid_char(c):
-        return PRINTABLE_ASCII(c) or c in CONTROL_CHARS or CHINESE(c) or MISC_SYMBOLS(c) or DINGBATS(c) or EMOJIS(c)
+    return cleaned_text
 
-    cleaned_text = "".join(char for char in text if is_valid_char(char))
-    cleaned_text = re.sub(r"\n{3,}", r"\n\n", cleaned_text)
-    cleaned_text = re.sub(r" {2,}", " ", cleaned_text)
 
-    return cleaned_text
+def _content_key(content: str) -> bytes:
+    """Digest used to look up the cached summary of a piece of content."""
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
 
-def _summarize_content(response: dict) -> None:
-    """Helper function to summarize content using LLM."""
-    from langchain_core.prompts import ChatPromptTemplate
-    from langchain_openai import ChatOpenAI
+def _summarize_content(results: list[dict]) -> None:
+    """Summarize the raw content of search results in place using LLM.
+
+    Uses the threaded `chain.batch` rather than `abatch`, since the async OpenAI client is cached per process and its
+    pooled connections cannot outlive the event loop that opened them.
+    """
+    chain = _get_summary_chain()
+
+    # Only summarize results that actually have raw content and no cached summary, once per distinct content
+    keys = [_content_key(result["raw_content"]) if result["raw_content"] is not None else None for result in results]
+    with _SUMMARY_CACHE_LOCK:
+        summaries = {key: _SUMMARY_CACHE[key] for key in keys if key in _SUMMARY_CACHE}
+    pending = {key: result["raw_content"] for key, result in zip(keys, results) if key is not None and key not in summaries}
+
+    if pending:
+        summarized_content_list = chain.batch(list(pending.values()), config={"max_concurrency": min(len(pending), 10)})
+        summaries.update((key, msg.content) for key, msg in zip(pending, summarized_content_list))
+
+    for key, result in zip(keys, results):
+        if key is not None:
+            result["content"] = summaries[key]
+
+    with _SUMMARY_CACHE_LOCK:
+        for key, summary in summaries.items():
+            _SUMMARY_CACHE[key] = summary
+            _SUMMARY_CACHE.move_to_end(key)
+        while len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+
+
+def _clean_result(result: dict, clean_raw_content: bool) -> dict:
+    """Return a copy of a search result with garbage removed from its content fields.
+
+    Raw content is only cleaned when `clean_raw_content` is set, since it is otherwise unused.
+    """
+    content, raw_content = result["content"], result.get("raw_content")
+    if not clean_raw_content:
+        return {**result, "content": filter_garbage(content) if content is not None else None, "raw_content": raw_content}
+
+    cleaned_raw_content = filter_garbage(raw_content) if raw_content is not None else None
+    # Tavily often returns the same text for both fields, so avoid cleaning it twice
+    if content is raw_content or content == raw_content:
+        cleaned_content = cleaned_raw_content
+    else:
+        cleaned_content = filter_garbage(content) if content is not None else None
+    return {**result, "content": cleaned_content, "raw_content": cleaned_raw_content}
 
-    summarizer = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", "Summarize the following content in 200 words: {raw_content}"),
-        ]
-    )
-    chain = prompt | summarizer
 
-    raw_content_list = [result["raw_content"] for result in response["results"]]
-    none_idx = [i for i, content in enumerate(raw_content_list) if content is None]
+def _clean_response(response: dict, args: SearchArgs) -> None:
+    """Filter results below the score threshold and clean their content in place."""
+    filter_score, summarize_content = args.filter_score, args.summarize_content
+    response["results"] = [_clean_result(result, summarize_content) for result in response["results"] if result["score"] >= filter_score]
 
-    summarized_content_list = chain.batch(raw_content_list)
-    content_list = [None if i in none_idx else msg.content for i, msg in enumerate(summarized_content_list)]
 
-    for i, result in enumerate(response["results"]):
-        if content_list[i] is not None:
-            result["content"] = content_list[i]
+def _format_response(response: dict, args: SearchArgs) -> str:
+    """Format a processed Tavily response into the text returned to the caller."""
+    buffer = io.StringIO()
+    buffer.write(f"Query: {response['query']}\n\nSources:\n")
+    for result in response["results"]:
+        buffer.write(f"\nRelevance Score: {result['score']}\nURL: {result['url']}\nContent: {result['content']}\n")
+    if args.suggested_answer:
+        buffer.write(f"\nSuggested Answer: {response['answer']}")
+
+    return buffer.getvalue()
 
 
 def process_response(response: dict, args: SearchArgs) -> str:
@@ -97,35 +278,12 @@ def process_response(response: dict, args: SearchArgs) -> str:
     Returns:
         str: Formatted string containing filtered and processed search results
     """
-    response["results"] = [result for result in response["results"] if result["score"] >= args.filter_score]
-
-    for result in response["results"]:
-        if result["content"] is not None:
-            result["content"] = filter_garbage(result["content"])
-        if result["raw_content"] is not None:
-            result["raw_content"] = filter_garbage(result["raw_content"])
+    _clean_response(response, args)
 
     if args.summarize_content:
-        _summarize_content(response)
+        _summarize_content(response["results"])
 
-    content = [
-        f"Query: {response['query']}\n",
-        "Sources:\n",
-    ]
-
-    for result in response["results"]:
-        content.extend(
-            [
-                f"Relevance Score: {result['score']}",
-                f"URL: {result['url']}",
-                f"Content: {result['content']}\n",
-            ]
-        )
-
-    if args.suggested_answer:
-        content.append(f"Suggested Answer: {response['answer']}")
-
-    return "\n".join(content)
+    return _format_response(response, args)
 
 
 def websearch(
@@ -155,3 +313,48 @@ def websearch(
     )
     response = tavily_search(args)
     return process_response(response, args)
+
+
+def websearch_many(
+    queries: list[str],
+    max_results: int = 5,
+    filter_score: float = 0.5,
+    summarize_content: bool = False,
+    suggested_answer: bool = False,
+) -> list[str]:
+    """Execute several web searches concurrently and process the results.
+
+    All Tavily searches run in parallel, and the content of every response is summarized in a single LLM batch.
+
+    Args:
+        queries (list[str]): Search query strings
+        max_results (int): Maximum number of results per query
+        filter_score (float): Minimum score threshold for filtering results
+        summarize_content (bool): Whether to summarize content using LLM
+        suggested_answer (bool): Whether to provide a suggested answer
+
+    Returns:
+        list[str]: Processed and formatted search results, in the same order as `queries`
+    """
+    args_list = [
+        SearchArgs(
+            query=query,
+            max_results=max_results,
+            filter_score=filter_score,
+            summarize_content=summarize_content,
+            suggested_answer=suggested_answer,
+        )
+        for query in queries
+    ]
+    if not args_list:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(args_list), _TAVILY_POOL_SIZE)) as executor:
+        responses = list(executor.map(tavily_search, args_list))
+
+    for response, args in zip(responses, args_list):
+        _clean_response(response, args)
+
+    if summarize_content:
+        _summarize_content([result for response in responses for result in response["results"]])
+
+    return [_format_response(response, args) for response, args in zip(responses, args_list)]
@@ -1,4 +1,4 @@
-from .WebSearch import websearch
+from .WebSearch import clear_search_cache, websearch, websearch_many
 from .YouTubeLoader import youtubeloader
 
-__all__ = ["websearch", "youtubeloader"]
+__all__ = ["clear_search_cache", "websearch", "websearch_many", "youtubeloader"]
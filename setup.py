@@ -65,6 +65,10 @@ setup(
         "transformers",
         "tqdm",
     ],
+    extras_require={
+        # Faster garbage filtering of long web search results
+        "numba": ["numba", "numpy"],
+    },
     python_requires=">=3.9",
     classifiers=[
         "Development Status :: 3 - Alpha",